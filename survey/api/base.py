@@ -25,7 +25,6 @@
 from rest_framework import generics
 
 from .. import settings
-from ..compat import six
 
 
 class QuestionListAPIView(generics.ListAPIView):
@@ -33,11 +32,12 @@ class QuestionListAPIView(generics.ListAPIView):
     @property
     def db_path(self):
         if not hasattr(self, '_db_path'):
-            #pylint:disable=attribute-defined-outside-init
-            self._db_path = self.kwargs.get(self.path_url_kwarg, '').replace(
+            db_path = self.kwargs.get(self.path_url_kwarg, '').replace(
                 settings.URL_PATH_SEP, settings.DB_PATH_SEP)
-            if not self._db_path.startswith(settings.DB_PATH_SEP):
-                self._db_path = settings.DB_PATH_SEP + self._db_path
+            if not db_path.startswith(settings.DB_PATH_SEP):
+                db_path = settings.DB_PATH_SEP + db_path
+            #pylint:disable=attribute-defined-outside-init
+            self._db_path = db_path
         return self._db_path
 
 
@@ -47,8 +47,8 @@ class QuestionListAPIView(generics.ListAPIView):
 
 
     def get_decorated_questions(self, prefix=None):
-        return list(six.itervalues(self.get_questions_by_key(
-            prefix=prefix if prefix else settings.DB_PATH_SEP)))
+        return list(self.get_questions_by_key(
+            prefix=prefix if prefix else settings.DB_PATH_SEP).values())
 
 
     def get_queryset(self):
@@ -57,7 +57,8 @@ class QuestionListAPIView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super(QuestionListAPIView, self).get_serializer_context()
+        db_path = self.db_path
         context.update({
-            'prefix': self.db_path if self.db_path else settings.DB_PATH_SEP,
+            'prefix': db_path if db_path else settings.DB_PATH_SEP,
         })
         return context
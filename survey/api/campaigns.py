@@ -22,11 +22,18 @@
 # OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
 # ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import logging
+import hashlib, json, logging
 
-from rest_framework import generics
+from django.core.cache import cache
+from django.db import models
+from django.utils.http import parse_etags
+from rest_framework import generics, response as http, status
 
+from .. import settings
 from ..mixins import CampaignMixin, CampaignQuerysetMixin, DateRangeContextMixin
+from ..models import Campaign, Choice
+from ..utils import get_question_model
+from ..renderers import get_renderer_classes
 from .serializers import (CampaignSerializer, CampaignDetailSerializer,
     CampaignCreateSerializer)
 from ..filters import DateRangeFilter, OrderingFilter, SearchFilter
@@ -129,9 +136,58 @@ class CampaignAPIView(CampaignMixin, generics.RetrieveDestroyAPIView):
         }
     """
     serializer_class = CampaignDetailSerializer
+    renderer_classes = get_renderer_classes()
+
+    def get_queryset(self):
+        queryset = Campaign.objects.all()
+        if self.request.method.lower() not in ('delete', 'options'):
+            # Loads the questions, their default unit and the unit choices
+            # in a fixed number of queries instead of one per question.
+            # There is no need to do so when we are not going to
+            # serialize the campaign.
+            queryset = queryset.select_related('account').prefetch_related(
+                models.Prefetch('questions',
+                    queryset=get_question_model().objects.select_related(
+                        'content', 'default_unit')),
+                models.Prefetch('questions__default_unit__enums',
+                    queryset=Choice.objects.filter(
+                        question__isnull=True).order_by('rank'),
+                    to_attr='prefetched_choices'))
+        return queryset
 
     def get_object(self):
-        return self.campaign
+        if not hasattr(self, '_object'):
+            #pylint:disable=attribute-defined-outside-init
+            self._object = generics.get_object_or_404(self.get_queryset(),
+                slug=self.kwargs.get(self.campaign_url_kwarg))
+        return self._object
+
+    def retrieve(self, request, *args, **kwargs):
+        if not settings.CAMPAIGN_CACHE_TIMEOUT:
+            return super(CampaignAPIView, self).retrieve(
+                request, *args, **kwargs)
+        # The representation of a campaign changes rarely and is the same
+        # for every user that has access to it, so we cache it along with
+        # an ETag that lets clients skip the payload altogether.
+        cache_key = Campaign.DETAIL_CACHE_KEY % self.kwargs.get(
+            self.campaign_url_kwarg)
+        cached = cache.get(cache_key)
+        if cached is None:
+            data = self.get_serializer(self.get_object()).data
+            etag = '"%s"' % hashlib.md5(json.dumps(data, sort_keys=True,
+                default=str).encode('utf-8')).hexdigest()
+            cached = (etag, data)
+            cache.set(cache_key, cached, settings.CAMPAIGN_CACHE_TIMEOUT)
+        etag, data = cached
+        # Weak comparison, as specified for If-None-Match in RFC 7232.
+        if_none_match = [val[2:] if val.startswith('W/') else val
+            for val in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))]
+        if '*' in if_none_match or etag in if_none_match:
+            resp = http.Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            resp = http.Response(data)
+        resp['ETag'] = etag
+        return resp
 
     def delete(self, request, *args, **kwargs):
         """
@@ -199,11 +255,19 @@ class CampaignListAPIView(SmartCampaignListMixin, CampaignQuerysetMixin,
         }
     """
     serializer_class = CampaignSerializer
+    serializer_classes_by_method = {'POST': CampaignCreateSerializer}
+    renderer_classes = get_renderer_classes()
+
+    def get_queryset(self):
+        # Only loads the columns `CampaignSerializer` needs.
+        return super(CampaignListAPIView, self).get_queryset().select_related(
+            'account').only('slug', 'title', 'description', 'created_at',
+            'is_active', 'is_commons',
+            'account__%s' % settings.BELONGS_LOOKUP_FIELD)
 
     def get_serializer_class(self):
-        if self.request.method.lower() == 'post':
-            return CampaignCreateSerializer
-        return super(CampaignListAPIView, self).get_serializer_class()
+        return self.serializer_classes_by_method.get(
+            self.request.method, self.serializer_class)
 
     def post(self, request, *args, **kwargs):
         """
@@ -25,7 +25,9 @@
 import datetime, logging, re
 from collections import OrderedDict
 
+from django.core.cache import cache
 from django.db import transaction, IntegrityError, models
+from django.db.models.functions import Coalesce
 from django.http import Http404
 from django.template.defaultfilters import slugify
 from rest_framework import generics, response as http, status
@@ -33,7 +35,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.mixins import DestroyModelMixin, UpdateModelMixin
 
 from .. import settings
-from ..compat import reverse, six
+from ..compat import reverse
 from ..docs import extend_schema
 from ..filters import AggregateByPeriodFilter, OrderingFilter, SearchFilter
 from ..helpers import construct_periods, convert_dates_to_utc, datetime_or_now
@@ -43,6 +45,7 @@ from ..models import (Answer, Choice, Matrix, EditableFilter,
     EditableFilterEnumeratedAccounts, Sample, Unit, UnitEquivalences)
 from ..pagination import MetricsPagination
 from ..queries import get_benchmarks_counts
+from ..renderers import get_renderer_classes
 from ..utils import (get_accessible_accounts, get_account_model,
     get_question_model, get_engaged_accounts, get_account_serializer,
     get_question_serializer, handle_uniq_error)
@@ -57,6 +60,13 @@ from .serializers import (AccountsDateRangeQueryParamSerializer,
 
 LOGGER = logging.getLogger(__name__)
 
+LIKELY_METRIC_RE = re.compile(r"(\S+)(-\d+)")
+
+MAX_INLINED_QUESTIONS = 500
+
+# SQLite limits the number of terms in a compound SELECT to 500 by default.
+MAX_UNION_QUERYSETS = 100
+
 
 class AccountsDateRangeMixin(object):
 
@@ -1350,7 +1360,12 @@ class MatrixCreateAPIView(generics.ListCreateAPIView):
     serializer_class = MatrixSerializer
 
     def get_queryset(self):
-        return Matrix.objects.all()
+        # Loads the columns and relations `MatrixSerializer` needs upfront.
+        return Matrix.objects.select_related(
+            'metric__account', 'cut__account').prefetch_related(
+            models.Prefetch('cohorts',
+                queryset=EditableFilter.objects.select_related('account'))
+            ).only('slug', 'title', 'metric', 'cut').order_by('slug')
 
     def post(self, request, *args, **kwargs):
         """
@@ -1432,6 +1447,10 @@ class MatrixDetailAPIView(MatrixMixin, generics.RetrieveUpdateDestroyAPIView):
     lookup_field = 'slug'
     lookup_url_kwarg = 'path'
     question_model = get_question_serializer().Meta.model
+    renderer_classes = get_renderer_classes()
+    # `EditableFilterSerializer` does not depend on the request, so a single
+    # instance is used to represent the metric, cut and cohorts.
+    filter_serializer = EditableFilterSerializer()
 
     def put(self, request, *args, **kwargs):
         """
@@ -1479,7 +1498,7 @@ class MatrixDetailAPIView(MatrixMixin, generics.RetrieveUpdateDestroyAPIView):
             DELETE /api/energy-utility/reporting/sustainability/matrix/languages HTTP/1.1
         """
         #pylint:disable=useless-super-delegation
-        return super(MatrixDetailAPIView, self).put(
+        return super(MatrixDetailAPIView, self).delete(
             request, *args, **kwargs)
 
     def aggregate_scores(self, metric, cohorts, cut=None, accounts=None):
@@ -1487,44 +1506,93 @@ class MatrixDetailAPIView(MatrixMixin, generics.RetrieveUpdateDestroyAPIView):
         if accounts is None:
             accounts = get_account_model().objects.all()
         scores = {}
-        if metric:
+        if metric and cohorts:
             assert 'metric' in metric.tags, \
                 "filter '%s' is not tagged as a metric" % str(metric)
             includes, excludes = metric.as_kwargs()
             questions = self.question_model.objects.filter(
                 **includes).exclude(**excludes)
-            nb_questions = len(questions)
+            # When the metric is made of a reasonable number of questions,
+            # we pass their ids as a literal list to the answers query.
+            question_ids = list(questions.values_list(
+                'pk', flat=True)[:MAX_INLINED_QUESTIONS + 1])
+            if len(question_ids) <= MAX_INLINED_QUESTIONS:
+                nb_questions = len(question_ids)
+            else:
+                nb_questions = questions.count()
+                question_ids = questions.values('pk')
             if nb_questions > 0:
+                accounts_by_cohort = []
+                members_querysets = []
                 for cohort in cohorts:
                     if isinstance(cohort, EditableFilter):
+                        # Accounts in an `EditableFilter` cohort are resolved
+                        # for all cohorts at once below.
                         includes, excludes = cohort.as_kwargs()
-                        qs_accounts = accounts.filter(
-                            **includes).exclude(**excludes)
+                        members_querysets += [accounts.filter(
+                            **includes).exclude(**excludes).annotate(
+                            cohort_index=models.Value(len(accounts_by_cohort),
+                                output_field=models.IntegerField())).order_by(
+                            ).values_list('pk', 'cohort_index')]
+                        account_ids = set()
                     else:
                         # If `matrix.cohorts is None`, the `cohorts` argument
                         # will be a list of single account objects.
-                        qs_accounts = [cohort]
-                    nb_accounts = len(qs_accounts)
+                        account_ids = {cohort.pk}
+                    accounts_by_cohort += [(cohort, account_ids)]
+                for idx in range(0, len(members_querysets),
+                        MAX_UNION_QUERYSETS):
+                    batch = members_querysets[idx:idx + MAX_UNION_QUERYSETS]
+                    for account_id, cohort_index in batch[0].union(
+                            *batch[1:], all=True):
+                        accounts_by_cohort[cohort_index][1].add(account_id)
+                # We count correct answers per account in a single query
+                # then add them up for each cohort. All cohort members
+                # are in `accounts` so we filter on it as a subquery rather
+                # than inline a list of ids that grows with the accounts.
+                is_correct = models.Q(
+                    measured=models.F('question__correct_answer'))
+                nb_correct_answers_by_account = dict(
+                    Answer.objects.filter(
+                        question__in=question_ids,
+                        sample__account__in=accounts).values(
+                        'sample__account_id').annotate(
+                        nb_correct_answers=models.Count(
+                            'pk', filter=is_correct)).values_list(
+                        'sample__account_id', 'nb_correct_answers'))
+                for cohort, account_ids in accounts_by_cohort:
+                    nb_accounts = len(account_ids)
                     if nb_accounts > 0:
-                        nb_correct_answers = Answer.objects.filter(
-                            question__in=questions,
-                            sample__account__in=qs_accounts).filter(
-                                measured=models.F('question__correct_answer')).count()
+                        cohort_key = str(cohort)
+                        nb_correct_answers = sum([
+                            nb_correct_answers_by_account.get(account_id, 0)
+                            for account_id in account_ids])
                         score = nb_correct_answers * 100 / (
                             nb_questions * nb_accounts)
                         LOGGER.debug("score for '%s' = (%d * 100) "\
-                            "/ (%d * %d) = %f", str(cohort), nb_correct_answers,
-                            nb_questions, nb_accounts, score)
+                            "/ (%d * %d) = %f", cohort_key,
+                            nb_correct_answers, nb_questions, nb_accounts,
+                            score)
                         assert score <= 100
-                        scores.update({str(cohort): score})
+                        scores.update({cohort_key: score})
         return {"scores": scores}
 
     @property
     def matrix(self):
         #pylint:disable=attribute-defined-outside-init
         if not hasattr(self, '_matrix'):
-            self._matrix = Matrix.objects.filter(
-                slug=self.kwargs.get(self.matrix_url_kwarg)).first()
+            self._matrix = None
+            slug = self.kwargs.get(self.matrix_url_kwarg)
+            # A path made of a matrix and a metric slug cannot be
+            # a matrix slug by itself.
+            if '/' not in slug:
+                try:
+                    # Only the columns `get_scores` needs.
+                    self._matrix = Matrix.objects.select_related(
+                        'metric', 'cut').only('slug', 'metric', 'cut').get(
+                        slug=slug)
+                except Matrix.DoesNotExist:
+                    pass
         return self._matrix
 
     def get_accounts(self):
@@ -1539,78 +1607,122 @@ class MatrixDetailAPIView(MatrixMixin, generics.RetrieveUpdateDestroyAPIView):
         or a metric and expect the system will magically switch between
         both meaning. This is an attempt at magic.
         """
-        likely_metric = None
-        look = re.match(r"(\S+)(-\d+)", cohort_slug)
-        if look:
-            try:
-                likely_metric = self.request.build_absolute_uri(
-                    reverse('matrix_chart', args=(
-                        EditableFilter.objects.get(slug=look.group(1)).slug,)))
-            except EditableFilter.DoesNotExist:
-                pass
-        return likely_metric
+        return self.get_likely_metrics([cohort_slug]).get(cohort_slug)
+
+    def get_likely_metrics(self, cohort_slugs):
+        """
+        Returns a dictionary of URLs to a ``Matrix`` derived from each cohort
+        in *cohort_slugs*, keyed by cohort slug.
 
+        All candidate ``EditableFilter`` are looked up in a single query.
+        """
+        candidates = {}
+        for cohort_slug in cohort_slugs:
+            look = LIKELY_METRIC_RE.match(cohort_slug)
+            if look:
+                candidates.update({cohort_slug: look.group(1)})
+        likely_metrics = {}
+        if candidates:
+            existing = set(EditableFilter.objects.filter(
+                slug__in=set(candidates.values())).values_list(
+                'slug', flat=True))
+            for cohort_slug, metric_slug in candidates.items():
+                if metric_slug in existing:
+                    likely_metrics.update({
+                        cohort_slug: self.request.build_absolute_uri(
+                            reverse('matrix_chart', args=(metric_slug,)))})
+        return likely_metrics
+
+
+    def get_cache_key(self):
+        """
+        Returns the key the response is cached under.
+
+        Subclasses that score a different set of accounts depending
+        on the request should add that context to the key.
+        """
+        return Matrix.get_cache_key(self.request.build_absolute_uri(
+            self.request.path))
 
     def get(self, request, *args, **kwargs):
-        #pylint:disable=unused-argument,too-many-locals
+        if settings.MATRIX_CACHE_TIMEOUT:
+            cache_key = self.get_cache_key()
+            result = cache.get(cache_key)
+            if result is None:
+                result = self.get_scores()
+                cache.set(cache_key, result, settings.MATRIX_CACHE_TIMEOUT)
+        else:
+            result = self.get_scores()
+        return http.Response(result)
+
+    def get_scores(self):
+        #pylint:disable=too-many-locals
         matrix = self.matrix
         if matrix:
-            metric = self.matrix.metric
+            metric = matrix.metric
         else:
             parts = self.kwargs.get(self.matrix_url_kwarg).split('/')
+            if len(parts) < 2:
+                # We already looked up a matrix with that slug.
+                raise Http404()
             metric = generics.get_object_or_404(EditableFilter.objects.all(),
                 slug=parts[-1])
-            matrix = Matrix.objects.filter(slug=parts[0]).first()
-        if not matrix:
-            raise Http404()
-
-        cohort_serializer = EditableFilterSerializer
-        cohorts = matrix.cohorts.exclude(tags__contains='aggregate')
-        public_cohorts = matrix.cohorts.filter(tags__contains='aggregate')
+            matrix = generics.get_object_or_404(Matrix.objects.select_related(
+                'cut').only('slug', 'cut'), slug=parts[0])
+
+        filter_serializer = self.filter_serializer
+        cohort_serializer = filter_serializer
+        cohorts = []
+        public_cohorts = []
+        for cohort in matrix.cohorts.select_related(
+                'account').prefetch_related('predicates'):
+            if 'aggregate' in (cohort.tags or ""):
+                public_cohorts += [cohort]
+            else:
+                cohorts += [cohort]
         cut = matrix.cut
+        all_accounts = self.get_accounts()
         if not cohorts:
             # We don't have any cohorts, let's show individual accounts instead.
             if cut:
                 includes, excludes = cut.as_kwargs()
-                accounts = self.get_accounts().filter(
+                accounts = all_accounts.filter(
                     **includes).exclude(**excludes)
             else:
-                accounts = self.get_accounts()
-            cohort_serializer = get_account_serializer()
+                accounts = all_accounts
+            cohort_serializer = get_account_serializer()()
             # Implementation Note: switch cohorts from an queryset
             # of `EditableFilter` to a queryset of `Account` ...
             cohorts = accounts
 
         result = []
-        scores = {}
         val = {
             'slug': metric.slug,
             'title': metric.title,
-            'metric': EditableFilterSerializer().to_representation(metric),
-            'cut': (EditableFilterSerializer().to_representation(cut)
+            'metric': filter_serializer.to_representation(metric),
+            'cut': (filter_serializer.to_representation(cut)
                 if cut else None),
-            'cohorts': cohort_serializer(many=True).to_representation(cohorts)}
+            'cohorts': [cohort_serializer.to_representation(cohort)
+                for cohort in cohorts]}
 
         # In some case, a metric and cohort have a connection
         # and could have the same name.
+        likely_metrics = self.get_likely_metrics(
+            [cohort['slug'] for cohort in val['cohorts']])
         for cohort in val['cohorts']:
-            likely_metric = self.get_likely_metric(cohort['slug'])
+            likely_metric = likely_metrics.get(cohort['slug'])
             if likely_metric:
                 cohort['likely_metric'] = likely_metric
 
-        scores.update(val)
-        scores.update({"values": self.aggregate_scores(
-            metric, cohorts, cut, accounts=self.get_accounts())})
-        result += [scores]
+        result += [dict(val, values=self.aggregate_scores(
+            metric, cohorts, cut, accounts=all_accounts))]
         if public_cohorts:
-            public_scores = {}
-            public_scores.update(val)
-            public_scores.update(
-                {"cohorts": EditableFilterSerializer(
-                    public_cohorts, many=True).data,
-                 "values": self.aggregate_scores(metric, public_cohorts)})
-            result += [public_scores]
-        return http.Response(result)
+            # The metric and cut representations are shared with `val`.
+            result += [dict(val,
+                cohorts=[filter_serializer.to_representation(cohort)
+                    for cohort in public_cohorts],
+                values=self.aggregate_scores(metric, public_cohorts))]
+        return result
 
 
 class EditableFilterQuerysetMixin(AccountMixin):
@@ -1699,7 +1811,8 @@ class AccountsFilterDetailAPIView(EditableFilterMixin,
 
     def get_queryset(self):
         return self.model.objects.filter(
-            editable_filter=self.editable_filter).order_by('rank')
+            editable_filter=self.editable_filter).select_related(
+            'account', 'question__default_unit').order_by('rank')
 
     def get_serializer_class(self):
         if self.request.method.lower() == 'post':
@@ -1829,6 +1942,20 @@ class AccountsFilterDetailAPIView(EditableFilterMixin,
             serializer.validated_data)
 
 
+    def get_next_rank(self):
+        """
+        Returns the rank of a predicate appended to the filter.
+
+        This method must be called inside a transaction. It locks the filter
+        row until the transaction ends so that concurrent requests appending
+        to the same filter cannot compute the same rank.
+        """
+        EditableFilter.objects.select_for_update().filter(
+            pk=self.editable_filter.pk).values_list('pk', flat=True).get()
+        return EditableFilterEnumeratedAccounts.objects.filter(
+            editable_filter=self.editable_filter).aggregate(
+            last_rank=Coalesce(models.Max('rank'), 0))['last_rank'] + 1
+
     def get_or_create_nominative_predicate(self, validated_data):
         # Create the `Account` (if necessary) and add it to the filter.
         full_name = validated_data.get('full_name')
@@ -1852,15 +1979,10 @@ class AccountsFilterDetailAPIView(EditableFilterMixin,
                         full_name=full_name, extra=extra)
                 except IntegrityError as err:
                     handle_uniq_error(err)
-            last_rank = EditableFilterEnumeratedAccounts.objects.filter(
-                editable_filter=self.editable_filter).aggregate(
-                models.Max('rank')).get('rank__max')
-            if not last_rank:
-                last_rank = 0
             enum_account = EditableFilterEnumeratedAccounts.objects.create(
                 account=account,
                 editable_filter=self.editable_filter,
-                rank=last_rank + 1)
+                rank=self.get_next_rank())
             account.rank = enum_account.rank
         return enum_account
 
@@ -1870,12 +1992,6 @@ class AccountsFilterDetailAPIView(EditableFilterMixin,
             get_question_model().objects.all(), path=validated_data.get('path'))
         measured = validated_data.get('measured')
         with transaction.atomic():
-            last_rank = EditableFilterEnumeratedAccounts.objects.filter(
-                editable_filter=self.editable_filter).aggregate(
-                models.Max('rank')).get('rank__max')
-            if not last_rank:
-                last_rank = 0
-
             unit = question.default_unit
             if unit.system == Unit.SYSTEM_ENUMERATED:
                 try:
@@ -1887,13 +2003,13 @@ class AccountsFilterDetailAPIView(EditableFilterMixin,
                     raise ValidationError("'%s' is not a valid choice."\
                         " Expected one of %s." % (measured,
                         [choice.get('text', "")
-                         for choice in six.itervalues(choices)]))
+                         for choice in choices.values()]))
 
             enum_account = EditableFilterEnumeratedAccounts.objects.create(
                 question=question,
                 measured=measured,
                 editable_filter=self.editable_filter,
-                rank=last_rank + 1)
+                rank=self.get_next_rank())
         return enum_account
 
 
@@ -1939,10 +2055,13 @@ class AccountsFilterEnumeratedAPIView(EditableFilterMixin,
 
 
     def get_queryset(self):
+        # `CohortSerializer` reads the account, question and, through
+        # `humanize_measured`, the question default unit.
         queryset = EditableFilterEnumeratedAccounts.objects.filter(
             editable_filter__account=self.account,
             editable_filter__slug=self.kwargs.get(
-                self.editable_filter_url_kwarg))
+                self.editable_filter_url_kwarg)).select_related(
+            'account', 'question__default_unit')
         return queryset
 
     def perform_update(self, serializer):
@@ -33,7 +33,7 @@ from rest_framework.generics import (get_object_or_404, RetrieveAPIView,
 from rest_framework.response import Response as HttpResponse
 from rest_framework.exceptions import ValidationError
 
-from ..compat import gettext_lazy as _, six
+from ..compat import gettext_lazy as _
 from ..docs import extend_schema
 from ..filters import AggregateByPeriodFilter, DateRangeFilter
 from ..helpers import datetime_or_now, get_extra
@@ -293,7 +293,7 @@ class AccountsFilterValuesAPIView(EditableFilterMixin, ListAPIView):
                 'unit': item.get('unit') # `unit` will be a `Unit` model.
             }]
         with transaction.atomic():
-            for account, measures in six.iteritems(measures_by_accounts):
+            for account, measures in measures_by_accounts.items():
                 create_answers = []
                 sample = Sample(
                     account=account,
@@ -32,7 +32,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response as HttpResponse
 
 from .. import settings, signals
-from ..compat import six, timezone_or_utc, gettext_lazy as _
+from ..compat import timezone_or_utc, gettext_lazy as _
 from ..docs import OpenApiResponse, extend_schema
 from ..helpers import datetime_or_now
 from ..mixins import AccountMixin, DateRangeContextMixin
@@ -282,7 +282,7 @@ class PortfoliosGrantsAPIView(SmartPortfolioListMixin,
         # set comprehension py2.7+ syntax
         model_fields = {
             field.name for field in account_model._meta.get_fields()}
-        for field_name in six.iterkeys(grantee_data):
+        for field_name in grantee_data:
             if field_name not in model_fields:
                 invalid_fields += [field_name]
         for field_name in invalid_fields:
@@ -600,7 +600,7 @@ class PortfoliosRequestsAPIView(SmartPortfolioListMixin,
                 # set comprehension py2.7+ syntax
                 model_fields = {
                     field.name for field in account_model._meta.get_fields()}
-                for field_name in six.iterkeys(account_data):
+                for field_name in account_data:
                     if field_name not in model_fields:
                         invalid_fields += [field_name]
                 for field_name in invalid_fields:
@@ -37,7 +37,7 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 
 from .. import settings
-from ..compat import six, is_authenticated, gettext_lazy as _
+from ..compat import is_authenticated, gettext_lazy as _
 from ..docs import OpenApiResponse, extend_schema
 from ..filters import (CampaignFilter, DateRangeFilter, OrderingFilter,
     SampleStateFilter)
@@ -120,7 +120,7 @@ def attach_answers(units, questions_by_key, queryset,
                 value.update({key: answers})
     # We re-order the answers so the default_unit (i.e. primary)
     # is first.
-    for question in six.itervalues(questions_by_key):
+    for question in questions_by_key.values():
         default_unit = question.get('default_unit')
         if isinstance(default_unit, Unit):
             default_units = [default_unit.slug]
@@ -309,7 +309,7 @@ def update_or_create_answer(datapoint, question, sample, created_at,
                         raise ValidationError(_("'%s' is not a valid choice."\
                             " Expected one of %s.") % (measured,
                             [choice.get('text', "")
-                             for choice in six.itervalues(choices)]))
+                             for choice in choices.values()]))
                 elif measured:
                     choice_rank = Choice.objects.filter(
                         unit=unit).aggregate(Max('rank')).get(
@@ -1443,7 +1443,7 @@ class SampleCandidatesAPIView(SampleCandidatesMixin, SampleAnswersMixin,
                         'system': question.default_unit.system
                     },
                     'ui_hint': question.ui_hint,
-                    'rate': {choice: 0 for choice in six.itervalues(choices)}
+                    'rate': {choice: 0 for choice in choices.values()}
                 }
             question = by_question[answer.question_id]
             if 'answers' not in question:
@@ -1461,7 +1461,7 @@ class SampleCandidatesAPIView(SampleCandidatesMixin, SampleAnswersMixin,
                 }]
         # XXX We re-order the answers so the default_unit (i.e. primary)
         # is first.
-        for question in six.itervalues(by_question):
+        for question in by_question.values():
             default_unit = question.get('default_unit').get('slug')
             answers = question.get('answers')
             primary = None
@@ -1479,7 +1479,7 @@ class SampleCandidatesAPIView(SampleCandidatesMixin, SampleAnswersMixin,
                     'ui_hint': question.get('ui_hint'),
                 }
             question.update({'answers': [primary] + remainders})
-        results = list(six.itervalues(by_question))
+        results = list(by_question.values())
 
         return self.get_http_response({'results': results},
             status=HTTP_201_CREATED if at_least_one_created else HTTP_200_OK,
@@ -2209,7 +2209,7 @@ class SampleRecentCreateAPIView(AccountMixin, generics.ListCreateAPIView):
                     frozen_by_campaigns[sample.campaign] = [sample]
                 else:
                     frozen_by_campaigns[sample.campaign] += [sample]
-        for campaign, samples in six.iteritems(frozen_by_campaigns):
+        for campaign, samples in frozen_by_campaigns.items():
             next_level = Portfolio.objects.filter(
                 account=self.account, campaign=campaign).values(
                     'ends_at', 'grantee__slug').order_by('-ends_at')
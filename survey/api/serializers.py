@@ -30,7 +30,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 
 from .. import settings
-from ..compat import gettext_lazy as _, reverse, six
+from ..compat import gettext_lazy as _, reverse
 from ..models import (EditableFilterEnumeratedAccounts, Answer, Campaign,
     Choice, EditableFilter, Matrix, PortfolioDoubleOptIn,
     Sample, Unit, convert_to_target_unit)
@@ -69,7 +69,7 @@ class EnumField(serializers.ChoiceField):
             raise ValidationError(_("'%(data)s' is not a valid choice."\
                 " Expected one of %(choices)s.") % {
                     'data': data, 'choices': [str(choice)
-                    for choice in six.iterkeys(self.choices)]})
+                    for choice in self.choices]})
         return result
 
 
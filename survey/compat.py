@@ -26,11 +26,8 @@
 #pylint: disable=no-name-in-module,unused-import
 import re
 from functools import WRAPPER_ASSIGNMENTS
-import six
-
-#pylint:disable=no-name-in-module,import-error
-from six.moves.urllib.parse import urlparse, urlunparse
-from six import StringIO
+from io import StringIO
+from urllib.parse import urlparse, urlunparse
 
 #pylint:disable=ungrouped-imports
 try:
@@ -123,14 +120,12 @@ except ImportError: # <= Django 2.0, Python<3.6
 
 try:
     from django.utils.encoding import python_2_unicode_compatible
-except ImportError: # django < 3.0
-    python_2_unicode_compatible = six.python_2_unicode_compatible
+except ImportError: # django >= 4.0
+    def python_2_unicode_compatible(klass):
+        return klass
 
 try:
-    if six.PY3:
-        from django.utils.encoding import force_str
-    else:
-        from django.utils.encoding import force_text as force_str
+    from django.utils.encoding import force_str
 except ImportError: # django < 3.0
     from django.utils.encoding import force_text as force_str
 
@@ -35,7 +35,7 @@ from rest_framework.filters import (OrderingFilter as BaseOrderingFilter,
 from rest_framework.compat import distinct
 
 from . import settings
-from .compat import force_str, six
+from .compat import force_str
 from .helpers import datetime_or_now, timezone_or_utc
 from .models import PortfolioDoubleOptIn
 
@@ -76,6 +76,8 @@ class SearchFilter(BaseSearchFilter):
 
     search_field_param = settings.SEARCH_FIELDS_PARAM
 
+    _default_fields_cache = {}
+
     def filter_queryset(self, request, queryset, view):
         search_fields = self.get_valid_fields(request, queryset, view)
         search_terms = self.get_search_terms(request)
@@ -86,7 +88,7 @@ class SearchFilter(BaseSearchFilter):
             return queryset
 
         orm_lookups = [
-            self.construct_search(six.text_type(search_field))
+            self.construct_search(str(search_field))
             for search_field in search_fields
         ]
 
@@ -201,8 +203,14 @@ class SearchFilter(BaseSearchFilter):
         # if there are no fields (due to empty query params or wrong
         # fields we fallback to fields specified in the view
         if not fields:
-            fields = getattr(view, 'search_fields', [])
-            fields = self.filter_valid_fields(queryset, fields, view)
+            # The fields specified in the view only depend on the view
+            # class and the model so we compute them once.
+            cache_key = (view.__class__, queryset.model)
+            fields = self._default_fields_cache.get(cache_key)
+            if fields is None:
+                fields = getattr(view, 'search_fields', [])
+                fields = self.filter_valid_fields(queryset, fields, view)
+                self._default_fields_cache[cache_key] = fields
         return fields
 
 
@@ -245,6 +253,8 @@ class SearchFilter(BaseSearchFilter):
 
 class OrderingFilter(BaseOrderingFilter):
 
+    _valid_fields_cache = {}
+
     def get_query_param(self, request, key, default_value=None):
         try:
             return request.query_params.getlist(key, default_value)
@@ -253,6 +263,20 @@ class OrderingFilter(BaseOrderingFilter):
         return request.GET.get(key, default_value)
 
     def get_valid_fields(self, queryset, view, context=None):
+        # When the view declares `ordering_fields`, valid fields only depend
+        # on the view class and the model so we compute them once.
+        ordering_fields = getattr(view, 'ordering_fields', None)
+        if ordering_fields is None or ordering_fields == '__all__':
+            return self._get_valid_fields(queryset, view, context=context)
+        cache_key = (view.__class__, queryset.model)
+        valid_fields = self._valid_fields_cache.get(cache_key)
+        if valid_fields is None:
+            valid_fields = self._get_valid_fields(
+                queryset, view, context=context)
+            self._valid_fields_cache[cache_key] = valid_fields
+        return valid_fields
+
+    def _get_valid_fields(self, queryset, view, context=None):
         #pylint:disable=protected-access
         if context is None:
             context = {}
@@ -318,7 +342,7 @@ class OrderingFilter(BaseOrderingFilter):
         default_ordering = list(ordering)
         params = self.get_query_param(request, self.ordering_param)
         if params:
-            if isinstance(params, six.string_types):
+            if isinstance(params, str):
                 params = params.split(',')
             fields = [param.strip() for param in params]
             alternate_fields = getattr(view, 'alternate_fields', {})
@@ -29,7 +29,6 @@ import uuid
 from django import forms
 from django.template.defaultfilters import slugify
 
-from .compat import six
 from .models import Answer, Campaign, EnumeratedQuestions, Sample
 from .utils import get_question_model
 
@@ -141,7 +140,7 @@ class SampleCreateForm(forms.ModelForm):
 
     def clean(self):
         super(SampleCreateForm, self).clean()
-        items = six.iteritems(self.cleaned_data)
+        items = list(self.cleaned_data.items())
         for key, value in items:
             if key.startswith('other-'):
                 if value:
@@ -36,7 +36,7 @@ from django.template.defaultfilters import slugify
 from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework.exceptions import ValidationError
 
-from .compat import timezone_or_utc, six
+from .compat import timezone_or_utc
 
 HOURLY = 'hourly'
 DAILY = 'daily'
@@ -97,7 +97,7 @@ def as_timestamp(dtime_at=None):
 def datetime_or_now(dtime_at=None, tzinfo=None):
     tzinfo = timezone_or_utc(tzinfo)
     as_datetime = dtime_at
-    if isinstance(dtime_at, six.string_types):
+    if isinstance(dtime_at, str):
         as_datetime = parse_datetime(dtime_at)
         if not as_datetime:
             as_date = parse_date(dtime_at)
@@ -210,7 +210,7 @@ def extra_as_internal(obj):
     try:
         if not obj.extra:
             return {}
-        if isinstance(obj.extra, six.string_types):
+        if isinstance(obj.extra, str):
             try:
                 obj.extra = json.loads(obj.extra)
             except (TypeError, ValueError):
@@ -222,7 +222,7 @@ def extra_as_internal(obj):
         extra = obj.get('extra', {})
         if not extra:
             return {}
-        if isinstance(extra, six.string_types):
+        if isinstance(extra, str):
             try:
                 obj.update({'extra': json.loads(extra)})
             except (TypeError, ValueError):
@@ -236,7 +236,7 @@ def extra_as_internal(obj):
 def get_extra(obj, attr_name, default=None):
     if not hasattr(obj, 'extra'):
         return default
-    if isinstance(obj.extra, six.string_types):
+    if isinstance(obj.extra, str):
         try:
             obj.extra = json.loads(obj.extra)
         except (TypeError, ValueError):
@@ -246,7 +246,7 @@ def get_extra(obj, attr_name, default=None):
 
 def update_context_urls(context, urls):
     if 'urls' in context:
-        for key, val in six.iteritems(urls):
+        for key, val in urls.items():
             if key in context['urls']:
                 if isinstance(val, dict):
                     context['urls'][key].update(val)
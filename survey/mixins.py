@@ -27,6 +27,7 @@ from __future__ import unicode_literals
 import datetime, logging
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from django.db import connections
 from django.db.models import Q, F
@@ -188,8 +189,18 @@ class CampaignMixin(object):
         if not hasattr(self, '_campaign'):
             campaign_slug = self.kwargs.get(self.campaign_url_kwarg)
             if campaign_slug:
-                self._campaign = get_object_or_404(
-                    Campaign.objects.all(), slug=campaign_slug)
+                # Requests that could modify the campaign always load it
+                # from the database, so they never save back a stale copy.
+                use_cache = (settings.CAMPAIGN_CACHE_TIMEOUT and
+                    self.request.method in ('GET', 'HEAD'))
+                cache_key = Campaign.CACHE_KEY % campaign_slug
+                self._campaign = cache.get(cache_key) if use_cache else None
+                if self._campaign is None:
+                    self._campaign = get_object_or_404(
+                        Campaign.objects.all(), slug=campaign_slug)
+                    if use_cache:
+                        cache.set(cache_key, self._campaign,
+                            settings.CAMPAIGN_CACHE_TIMEOUT)
             else:
                 self._campaign = None
         return self._campaign
@@ -32,11 +32,13 @@ used for reporting analytics.
 ``Portfolio`` and ``PortfolioDoubleOptIn`` implement access control to the
 underlying ``Sample`` accessible to an account/user.
 """
-import datetime, hashlib, random, uuid
+import datetime, hashlib, json, random, uuid
 
 from django import VERSION as DJANGO_VERSION
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.template.defaultfilters import slugify
 from django.utils import timezone
 
@@ -121,6 +123,11 @@ class Unit(models.Model):
     @property
     def choices(self):
         if self.system == self.SYSTEM_ENUMERATED:
+            # `prefetched_choices` is set when the unit was loaded through
+            # a ``Prefetch(..., to_attr='prefetched_choices')``.
+            prefetched_choices = getattr(self, 'prefetched_choices', None)
+            if prefetched_choices is not None:
+                return prefetched_choices
             return Choice.objects.filter(
                 question__isnull=True, unit=self).order_by('rank')
         return None
@@ -353,9 +360,19 @@ class Campaign(SlugifyFieldMixin, models.Model):
     extra = get_extra_field_class()(null=True, blank=True,
         help_text=_("Extra meta data (can be stringify JSON)"))
 
+    CACHE_KEY = 'survey.campaign.%s'
+    DETAIL_CACHE_KEY = 'survey.campaign.%s.detail'
+
     def __str__(self):
         return str(self.slug)
 
+    def clear_cache(self):
+        """
+        Removes the cached campaign and cached API representation.
+        """
+        cache.delete_many([
+            self.CACHE_KEY % self.slug, self.DETAIL_CACHE_KEY % self.slug])
+
     @property
     def has_questions(self):
         return self.questions.exists()
@@ -578,6 +595,14 @@ class AnswerManager(models.Manager):
         return kwargs
 
 
+    def bulk_create(self, objs, *args, **kwargs):
+        #pylint:disable=arguments-differ
+        result = super(AnswerManager, self).bulk_create(objs, *args, **kwargs)
+        if settings.MATRIX_CACHE_TIMEOUT:
+            # `bulk_create` does not send `post_save` signals.
+            clear_matrix_cache(sender=self.model, using=self.db)
+        return result
+
     def get_frozen_answers(self, campaign, samples, prefix=None, excludes=None):
         queryset = self.raw(sql_frozen_answers(
             campaign, samples, prefix=prefix, excludes=excludes))
@@ -631,6 +656,11 @@ class Answer(models.Model):
 
     class Meta:
         unique_together = ('sample', 'question', 'unit')
+        indexes = [
+            # Used to count correct answers when scoring a ``Matrix``.
+            models.Index(fields=['question', 'sample', 'measured'],
+                name='survey_answer_qsm_idx')
+        ]
 
     def __str__(self):
         if self.sample_id:
@@ -715,15 +745,33 @@ class EditableFilter(SlugifyFieldMixin, models.Model):
     def __str__(self):
         return str(self.slug)
 
+    @property
+    def tags(self):
+        """
+        Tags (ex: "metric", "aggregate") stored in the `extra` field.
+        """
+        extra = self.extra
+        if isinstance(extra, str):
+            try:
+                extra = json.loads(extra)
+            except (TypeError, ValueError):
+                extra = None
+        return extra.get('tags', "") if isinstance(extra, dict) else ""
+
     def as_kwargs(self):
-        includes = {}
-        excludes = {}
-        for predicate in self.predicates.all().order_by('rank'):
-            if predicate.selector == 'keepmatching':
-                includes.update(predicate.as_kwargs())
-            elif predicate.selector == 'removematching':
-                excludes.update(predicate.as_kwargs())
-        return includes, excludes
+        if not hasattr(self, '_as_kwargs'):
+            includes = {}
+            excludes = {}
+            # Sorting in Python lets callers prefetch the predicates.
+            for predicate in sorted(self.predicates.all(),
+                    key=lambda predicate: predicate.rank):
+                if predicate.selector == 'keepmatching':
+                    includes.update(predicate.as_kwargs())
+                elif predicate.selector == 'removematching':
+                    excludes.update(predicate.as_kwargs())
+            #pylint:disable=attribute-defined-outside-init
+            self._as_kwargs = (includes, excludes)
+        return self._as_kwargs
 
 
 @python_2_unicode_compatible
@@ -814,9 +862,35 @@ class Matrix(SlugifyFieldMixin, models.Model):
     extra = get_extra_field_class()(null=True, blank=True,
         help_text=_("Extra meta data (can be stringify JSON)"))
 
+    CACHE_KEY = 'survey.matrix.%s.%s'
+    CACHE_VERSION_KEY = 'survey.matrix.version'
+
     def __str__(self):
         return str(self.slug)
 
+    @classmethod
+    def get_cache_key(cls, path):
+        """
+        Returns the key the scores for the matrix at *path* are cached under.
+
+        *path* is hashed so the key stays short and only contains characters
+        all cache backends (ex: memcached) accept.
+        """
+        return cls.CACHE_KEY % (
+            cache.get_or_set(cls.CACHE_VERSION_KEY, 0, None),
+            hashlib.md5(path.encode('utf-8')).hexdigest())
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Invalidates the cached scores of all matrices.
+        """
+        if settings.MATRIX_CACHE_TIMEOUT:
+            try:
+                cache.incr(cls.CACHE_VERSION_KEY)
+            except ValueError:
+                cache.set(cls.CACHE_VERSION_KEY, 1, None)
+
 
 @python_2_unicode_compatible
 class Portfolio(models.Model):
@@ -1211,3 +1285,66 @@ def get_collected_by(campaign, start_at=None, ends_at=None,
         queryset = queryset.exclude(answer__question__in=excludes)
 
     return queryset.distinct()
+
+
+def clear_campaign_cache(sender, instance, using=None, **kwargs):
+    """
+    Removes a campaign from the cache once the transaction that modified
+    or deleted it is committed, so a concurrent request cannot put
+    the old row back in the cache.
+    """
+    #pylint:disable=unused-argument
+    transaction.on_commit(instance.clear_cache, using=using)
+
+
+def clear_campaign_questions_cache(sender, instance, using=None, **kwargs):
+    """
+    Removes the cached representation of a campaign once the transaction
+    that added or removed one of its questions is committed.
+    """
+    #pylint:disable=unused-argument
+    transaction.on_commit(instance.campaign.clear_cache, using=using)
+
+
+def clear_matrix_cache(sender, using=None, **kwargs):
+    """
+    Invalidates the cached scores of all matrices once the transaction
+    that modified an answer, a filter or a matrix is committed.
+    """
+    #pylint:disable=unused-argument
+    # The scores of all matrices are invalidated at once, so one callback
+    # per transaction is enough, however many rows it modifies.
+    connection = transaction.get_connection(using)
+    if not any(callback[1] == Matrix.clear_cache
+               for callback in connection.run_on_commit):
+        transaction.on_commit(Matrix.clear_cache, using=using)
+
+
+def clear_matrix_cohorts_cache(sender, action, using=None, **kwargs):
+    """
+    Invalidates the cached scores of all matrices once the transaction
+    that added or removed cohorts to a matrix is committed.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        clear_matrix_cache(sender, using=using, **kwargs)
+
+
+# Receivers prevent Django from deleting rows in bulk, so we only connect
+# them when there is a cache to invalidate.
+if settings.CAMPAIGN_CACHE_TIMEOUT:
+    post_save.connect(clear_campaign_cache, sender=Campaign)
+    post_delete.connect(clear_campaign_cache, sender=Campaign)
+    post_save.connect(clear_campaign_questions_cache,
+        sender=EnumeratedQuestions)
+    post_delete.connect(clear_campaign_questions_cache,
+        sender=EnumeratedQuestions)
+
+if settings.MATRIX_CACHE_TIMEOUT:
+    # Scores depend on the correct answer of each question. `QUESTION_MODEL`
+    # is referenced by name because it might not be loaded yet.
+    for _model in (Answer, EditableFilter, EditableFilterEnumeratedAccounts,
+                   EditablePredicate, Matrix, settings.QUESTION_MODEL):
+        post_save.connect(clear_matrix_cache, sender=_model)
+        post_delete.connect(clear_matrix_cache, sender=_model)
+    m2m_changed.connect(clear_matrix_cohorts_cache,
+        sender=Matrix.cohorts.through)
@@ -22,8 +22,6 @@
 # OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
 # ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from collections import OrderedDict
-
 from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
 
@@ -38,15 +36,15 @@ class MetricsPagination(BasePagination):
         return queryset
 
     def get_paginated_response(self, data):
-        return Response(OrderedDict([
-            ('title', getattr(self.view, 'title', "")),
-            ('scale', getattr(self.view, 'scale', 1)),
-            ('unit', getattr(self.view, 'unit', None)),
-            ('nb_accounts', getattr(self.view, 'nb_accounts', None)),
-            ('labels', getattr(self.view, 'labels', None)),
-            ('count', len(data)),
-            ('results', data)
-        ]))
+        return Response({
+            'title': getattr(self.view, 'title', ""),
+            'scale': getattr(self.view, 'scale', 1),
+            'unit': getattr(self.view, 'unit', None),
+            'nb_accounts': getattr(self.view, 'nb_accounts', None),
+            'labels': getattr(self.view, 'labels', None),
+            'count': len(data),
+            'results': data
+        })
 
     def get_paginated_response_schema(self, schema):
         if 'description' not in schema:
@@ -43,6 +43,7 @@ _SETTINGS = {
     'BELONGS_MODEL': None,
     'BELONGS_SERIALIZER': None,
     'BYPASS_SAMPLE_AVAILABLE': False,
+    'CAMPAIGN_CACHE_TIMEOUT': 0,
     'CONTENT_MODEL': 'survey.Content',
     'CONVERT_TO_QUESTION_SYSTEM': True,
     'CORRECT_MARKER': '(correct)',
@@ -50,6 +51,7 @@ _SETTINGS = {
     'DENORMALIZE_FOR_PRECISION': True,
     'EXTRA_FIELD': None,
     'FORCE_ONLY_QUESTION_UNIT': False,
+    'MATRIX_CACHE_TIMEOUT': 0,
     'QUESTION_MODEL': 'survey.Question',
     'QUESTION_SERIALIZER': 'survey.api.serializers.QuestionDetailSerializer',
     'SEARCH_FIELDS_PARAM': 'q_f',
@@ -80,6 +82,15 @@ BELONGS_SERIALIZER = (_SETTINGS.get('BELONGS_SERIALIZER')
 #: Outside very simple projects, this flag will most likely be used only
 #: for debugging purposes.
 BYPASS_SAMPLE_AVAILABLE = _SETTINGS.get('BYPASS_SAMPLE_AVAILABLE')
+#: Number of seconds a ``Campaign`` looked up by slug from the URL, and
+#: the representation (with its ETag) returned by the campaign detail API,
+#: are kept in the Django cache. Cached entries are removed once
+#: the transaction that saved or deleted the campaign, or one of its
+#: ``EnumeratedQuestions``, commits. Edits to the questions themselves
+#: (title, unit, choices) are only picked up when the entries expire.
+#: Use a cache backend shared by all processes (i.e. not the default
+#: `LocMemCache`) when enabling it. defaults to `0` (disabled).
+CAMPAIGN_CACHE_TIMEOUT = _SETTINGS.get('CAMPAIGN_CACHE_TIMEOUT')
 #: When set to `True` storing measure in the database will attempt to convert
 #: numerical unit to the question default unit. When set to `False`,
 #: no convertion is attempted and the measure is stored with the unit passed
@@ -97,6 +108,17 @@ EXTRA_FIELD = _SETTINGS.get('EXTRA_FIELD')
 #: When set to `True`, the measure stored in the database are guarenteed
 #: to be in the question's default_unit. defaults to `False`.
 FORCE_ONLY_QUESTION_UNIT = _SETTINGS.get('FORCE_ONLY_QUESTION_UNIT')
+#: Number of seconds the scores computed for a ``Matrix`` are kept
+#: in the Django cache. All cached scores are invalidated once the transaction
+#: that saves or deletes an ``Answer``, a question, an ``EditableFilter``,
+#: its ``EditablePredicate`` or enumerated accounts, or a ``Matrix``, or
+#: changes the cohorts of a matrix, commits. Changes to ``ACCOUNT_MODEL``
+#: rows, which can move accounts in or out of a cohort, and rows changed
+#: through `QuerySet.update()` are not detected; the scores are refreshed
+#: when the entries expire.
+#: Scores are cached per matrix, so this must remain `0` when the accounts
+#: scored depend on the request user. defaults to `0` (disabled).
+MATRIX_CACHE_TIMEOUT = _SETTINGS.get('MATRIX_CACHE_TIMEOUT')
 QUESTION_MODEL = _SETTINGS.get('QUESTION_MODEL')
 QUESTION_SERIALIZER = _SETTINGS.get('QUESTION_SERIALIZER')
 SEARCH_FIELDS_PARAM = _SETTINGS.get('SEARCH_FIELDS_PARAM')
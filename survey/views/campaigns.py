@@ -30,7 +30,7 @@ from django.views.generic import (DetailView,
 from django.template.defaultfilters import slugify
 
 from .. import settings
-from ..compat import six, reverse, reverse_lazy
+from ..compat import reverse, reverse_lazy
 from ..helpers import update_context_urls
 from ..mixins import BelongsMixin, CampaignMixin
 from ..models import Answer, Campaign, Sample
@@ -146,7 +146,7 @@ class CampaignResultView(CampaignMixin, DetailView):
 
             # Convert to json-ifiable format
             values = []
-            for label, value in six.iteritems(aggregate):
+            for label, value in aggregate.items():
                 if self.object.quizz_mode and label == question.correct_answer:
                     values += [{
                         "label": "%s %s" % (label, settings.CORRECT_MARKER),
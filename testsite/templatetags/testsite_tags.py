@@ -26,7 +26,7 @@ import json
 
 from django import template
 from django.utils.safestring import mark_safe
-from survey.compat import is_authenticated as is_authenticated_base, six
+from survey.compat import is_authenticated as is_authenticated_base
 
 
 register = template.Library()
@@ -39,6 +39,6 @@ def is_authenticated(request):
 
 @register.filter
 def to_json(value):
-    if isinstance(value, six.string_types):
+    if isinstance(value, str):
         return value
     return mark_safe(json.dumps(value))
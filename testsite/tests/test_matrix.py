@@ -0,0 +1,60 @@
+# Copyright (c) 2024, DjaoDjin inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+# ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from django.test import TestCase
+
+from survey.models import EditableFilter, Matrix
+
+
+class MatrixDetailAPITests(TestCase):
+
+    url = '/api/alliance/reporting/sustainability/matrix/%s'
+
+    def setUp(self):
+        metric = EditableFilter.objects.create(slug='totals',
+            title="Total score", extra='{"tags": "metric"}')
+        self.matrix = Matrix.objects.create(slug='languages',
+            title="Languages", metric=metric)
+        self.matrix.cohorts.add(
+            EditableFilter.objects.create(slug='suppliers',
+                title="Suppliers", extra='{"tags": ["cohort"]}'),
+            EditableFilter.objects.create(slug='smbs',
+                title="Small and medium businesses", extra='{"tags"'),
+            EditableFilter.objects.create(slug='industry',
+                title="Industry average", extra='{"tags": "aggregate"}'))
+
+    def test_get_splits_aggregate_cohorts(self):
+        resp = self.client.get(self.url % self.matrix.slug)
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(len(data), 2)
+        self.assertEqual(sorted([cohort['slug']
+            for cohort in data[0]['cohorts']]), ['smbs', 'suppliers'])
+        self.assertEqual([cohort['slug']
+            for cohort in data[1]['cohorts']], ['industry'])
+
+    def test_delete(self):
+        resp = self.client.delete(self.url % self.matrix.slug)
+        self.assertEqual(resp.status_code, 204)
+        self.assertFalse(Matrix.objects.filter(slug=self.matrix.slug).exists())
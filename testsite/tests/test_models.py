@@ -0,0 +1,69 @@
+# Copyright (c) 2024, DjaoDjin inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+# ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from django.test import SimpleTestCase
+
+from survey.models import EditableFilter
+
+
+class EditableFilterTagsTests(SimpleTestCase):
+    """
+    Tags are read out of the `extra` field.
+    """
+
+    def test_tags_in_extra(self):
+        editable_filter = EditableFilter(extra='{"tags": "aggregate"}')
+        self.assertEqual(editable_filter.tags, "aggregate")
+        self.assertTrue('aggregate' in editable_filter.tags)
+
+    def test_tags_as_list(self):
+        editable_filter = EditableFilter(extra='{"tags": ["metric"]}')
+        self.assertTrue('metric' in editable_filter.tags)
+        self.assertFalse('aggregate' in editable_filter.tags)
+
+    def test_no_extra(self):
+        for extra in (None, ""):
+            editable_filter = EditableFilter(extra=extra)
+            self.assertEqual(editable_filter.tags, "")
+
+    def test_invalid_json(self):
+        editable_filter = EditableFilter(extra='{"tags": "aggregate"')
+        self.assertEqual(editable_filter.tags, "")
+        self.assertFalse('aggregate' in editable_filter.tags)
+
+    def test_extra_not_a_dict(self):
+        for extra in ('["aggregate"]', '"aggregate"', '12'):
+            editable_filter = EditableFilter(extra=extra)
+            self.assertEqual(editable_filter.tags, "")
+
+    def test_missing_tags_key(self):
+        editable_filter = EditableFilter(
+            extra='{"path": "/sustainability/aggregate"}')
+        self.assertEqual(editable_filter.tags, "")
+
+    def test_extra_left_unchanged(self):
+        extra = '{"tags": "aggregate"}'
+        editable_filter = EditableFilter(extra=extra)
+        self.assertEqual(editable_filter.tags, "aggregate")
+        self.assertEqual(editable_filter.extra, extra)